@@ -8,12 +8,20 @@ Run with: streamlit run analytics_dashboard.py
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import pyarrow as pa
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from operator import itemgetter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from dotenv import load_dotenv
+import threading
 import time
 
 # Load environment variables
@@ -22,6 +30,62 @@ load_dotenv()
 BACKEND_URL = st.secrets["ANALYTICS_BACKEND_URL"]
 REFRESH_INTERVAL = int(st.secrets["DASHBOARD_REFRESH_INTERVAL"])
 
+ANALYTICS_ENDPOINTS = ["summary", "endpoints", "hourly", "errors", "daily"]
+
+# Endpoints that may be served as columnar Arrow IPC streams instead of JSON
+ARROW_ENDPOINTS = ["hourly", "daily"]
+ARROW_STREAM_TYPE = "application/vnd.apache.arrow.stream"
+
+# Static chart config: no mode bar and no window-resize relayout
+PLOTLY_CONFIG = {"displayModeBar": False, "staticPlot": False, "responsive": False}
+
+# Seconds to stop calling the backend after every endpoint has failed
+BREAKER_COOLDOWN = 30
+
+# Maximum number of memoized API responses kept across all sessions
+MEMO_SIZE = 64
+
+FOOTER_TEMPLATE = "Cynchrony Analytics Dashboard | Last updated: {timestamp} | Connected to: " + BACKEND_URL
+
+# (label, summary key) pairs for each metric row
+OVERVIEW_METRICS = [
+    ("Total API Calls", "total_api_calls"),
+    ("Success Rate", "success_rate"),
+    ("Total Errors", "total_errors"),
+    ("AI Chat Calls", "ai_chat_calls"),
+    ("AI Generation", "ai_generation_calls")
+]
+
+PROCESSING_METRICS = [
+    ("📄 PDF Processing", "pdf_processing"),
+    ("🖼️ Image Processing", "image_processing"),
+    ("🎬 Video Processing", "video_processing"),
+    ("🎵 Audio Processing", "audio_processing"),
+    ("💻 Code Executions", "code_executions"),
+    ("📁 File Uploads", "file_uploads")
+]
+
+BUSINESS_METRICS = [
+    ("🔐 Auth Events", "authentication_events"),
+    ("💳 Payment Events", "payment_events"),
+    ("📝 Assessments", "assessment_events"),
+    ("🎤 Interviews", "interview_events"),
+    ("📄 Resume Ops", "resume_operations")
+]
+
+# (divisor, suffix) pairs used by format_number, largest first
+NUMBER_SUFFIXES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+# (field, header, Arrow type) triples for the Recent Errors table
+ERROR_COLUMNS = [
+    ("endpoint", "Endpoint", pa.string()),
+    ("method", "Method", pa.string()),
+    ("status_code", "Status", pa.int64()),
+    ("error", "Error Message", pa.string()),
+    ("timestamp", "Timestamp", pa.string())
+]
+ERROR_SCHEMA = pa.schema([(key, arrow_type) for key, _, arrow_type in ERROR_COLUMNS])
+
 # Page configuration
 st.set_page_config(
     page_title="Cynchrony Analytics Dashboard",
@@ -30,8 +94,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, emitted together with the page header
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -70,35 +134,303 @@ st.markdown("""
         color: #ef4444;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 
-def fetch_data(endpoint: str):
-    """Fetch data from the analytics API."""
+@st.cache_resource
+def get_session():
+    """Shared HTTP session with connection pooling and keep-alive."""
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_etag_cache():
+    """Last (ETag, data) pair seen per endpoint, for conditional requests."""
+    return {}
+
+
+@st.cache_resource
+def get_memo():
+    """Process-wide LRU of recent API responses and the lock guarding it."""
+    return OrderedDict(), threading.Lock()
+
+
+def fetch_data(endpoint: str, cache_bust: int, interval: int, memo, lock, session, etags):
+    """Fetch data as a (data, error) tuple, memoized per endpoint and refresh window."""
+    key = (endpoint, interval, int(time.time() // interval), cache_bust)
+    with lock:
+        if key in memo:
+            memo.move_to_end(key)
+            return memo[key]
+    
+    result = request_data(endpoint, session, etags)
+    if result[1] is None:
+        with lock:
+            memo[key] = result
+            while len(memo) > MEMO_SIZE:
+                memo.popitem(last=False)
+    return result
+
+
+def request_data(endpoint: str, session, etags):
+    """Request data from the analytics API as a (data, error) tuple."""
+    cached = etags.get(endpoint)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    if endpoint in ARROW_ENDPOINTS:
+        headers["Accept"] = f"{ARROW_STREAM_TYPE}, application/json;q=0.9"
     try:
-        response = requests.get(f"{BACKEND_URL}/analytics/{endpoint}", timeout=10)
-        if response.status_code == 200:
-            return response.json().get("data", {})
+        response = session.get(f"{BACKEND_URL}/analytics/{endpoint}", headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            # Unchanged since the last poll; the backend sent no body
+            return cached[1], None
+        elif response.status_code == 200:
+            if response.headers.get("Content-Type", "").startswith(ARROW_STREAM_TYPE):
+                data = pa.ipc.open_stream(response.content).read_all().to_pandas()
+            else:
+                data = orjson.loads(response.content).get("data", {})
+            if "ETag" in response.headers:
+                etags[endpoint] = (response.headers["ETag"], data)
+            return data, None
         else:
-            st.error(f"Error fetching {endpoint}: {response.status_code}")
-            return None
+            return None, f"Error fetching {endpoint}: {response.status_code}"
     except requests.exceptions.ConnectionError:
-        st.error(f"Cannot connect to backend at {BACKEND_URL}. Make sure the server is running.")
-        return None
+        return None, f"Cannot connect to backend at {BACKEND_URL}. Make sure the server is running."
     except Exception as e:
-        st.error(f"Error fetching {endpoint}: {str(e)}")
+        return None, f"Error fetching {endpoint}: {str(e)}"
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def check_health():
+    """Return the backend health check status code, or None if unreachable."""
+    try:
+        return get_session().get(f"{BACKEND_URL}/health", timeout=5).status_code
+    except requests.exceptions.RequestException:
         return None
 
 
+def fetch_all(cache_bust: int, interval: int):
+    """Fetch every analytics endpoint concurrently."""
+    # Resolve cached resources on the script thread; workers have no ScriptRunContext
+    memo, lock = get_memo()
+    fetch = partial(
+        fetch_data,
+        cache_bust=cache_bust,
+        interval=interval,
+        memo=memo,
+        lock=lock,
+        session=get_session(),
+        etags=get_etag_cache()
+    )
+    with ThreadPoolExecutor(max_workers=len(ANALYTICS_ENDPOINTS)) as executor:
+        responses = executor.map(fetch, ANALYTICS_ENDPOINTS)
+        return dict(zip(ANALYTICS_ENDPOINTS, responses))
+
+
+def fetch_with_breaker(cache_bust: int, interval: int):
+    """Fetch all endpoints, skipping the backend while the circuit breaker is open."""
+    remaining = st.session_state.get("fail_until", 0) - time.time()
+    if remaining > 0:
+        # Re-surface the errors that opened the breaker
+        errors = st.session_state.get("fail_errors", {})
+        return {
+            endpoint: (None, f"{errors.get(endpoint) or 'Backend unavailable'}; retrying in {int(remaining) + 1}s")
+            for endpoint in ANALYTICS_ENDPOINTS
+        }
+    
+    results = fetch_all(cache_bust, interval)
+    if all(data is None for data, _ in results.values()):
+        st.session_state.fail_until = time.time() + BREAKER_COOLDOWN
+        st.session_state.fail_errors = {endpoint: error for endpoint, (_, error) in results.items()}
+    else:
+        st.session_state.pop("fail_until", None)
+        st.session_state.pop("fail_errors", None)
+    return results
+
+
+def load(results, endpoint: str):
+    """Return an endpoint's data from fetch_all results and render any error."""
+    data, error = results[endpoint]
+    if error:
+        st.error(error)
+    return data
+
+
+def bump_cache():
+    """Invalidate cached API responses and reset the circuit breaker for this session."""
+    # The memo is shared by all sessions, so the nonce must be unique across them
+    st.session_state.cache_bust = time.time_ns()
+    st.session_state.pop("fail_until", None)
+    st.session_state.pop("fail_errors", None)
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def make_category_fig(category_data):
+    """Build the category breakdown bar chart."""
+    items = sorted(category_data.items(), key=itemgetter(1))
+    labels = [k.replace("_", " ").title() for k, _ in items]
+    counts = [v for _, v in items]
+    
+    fig = go.Figure(go.Bar(
+        x=counts,
+        y=labels,
+        orientation="h",
+        marker=dict(color=counts, colorscale="Viridis", showscale=True, colorbar=dict(title="Count"))
+    ))
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        xaxis_title="Number of Calls",
+        yaxis_title=""
+    )
+    return fig
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def make_endpoints_fig(endpoints):
+    """Build the top endpoints bar chart, or None if there is no data."""
+    top = sorted(endpoints[:10], key=itemgetter("count"))
+    if not top:
+        return None
+    
+    fig = go.Figure(go.Bar(
+        x=[e["count"] for e in top],
+        y=[e["endpoint"] for e in top],
+        orientation="h",
+        marker=dict(
+            color=[e["success_rate"] for e in top],
+            colorscale="RdYlGn",
+            showscale=True,
+            colorbar=dict(title="Success %")
+        ),
+        hovertemplate="Endpoint=%{y}<br>Calls=%{x}<br>Success %=%{marker.color}<extra></extra>"
+    ))
+    fig.update_layout(
+        height=400,
+        xaxis_title="Calls",
+        yaxis_title="Endpoint"
+    )
+    return fig
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def make_hourly_fig(hourly):
+    """Build the hourly activity line chart, or None if there is no data."""
+    df = pd.DataFrame(hourly)
+    if df.empty:
+        return None
+    
+    hours = df["hour"].to_numpy()
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=hours,
+        y=df["count"].to_numpy(),
+        mode="lines+markers",
+        name="Total Calls",
+        line=dict(color="#667eea", width=2),
+        fill="tozeroy",
+        fillcolor="rgba(102, 126, 234, 0.2)"
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=hours,
+        y=df["success_count"].to_numpy(),
+        mode="lines+markers",
+        name="Successful",
+        line=dict(color="#10b981", width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=hours,
+        y=df["error_count"].to_numpy(),
+        mode="lines+markers",
+        name="Errors",
+        line=dict(color="#ef4444", width=2)
+    ))
+    
+    fig.update_layout(
+        height=300,
+        xaxis_title="Hour",
+        uirevision="constant",
+        yaxis_title="Number of Calls",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def make_daily_fig(daily):
+    """Build the stacked daily statistics bar chart, or None if there is no data."""
+    df = pd.DataFrame(daily)
+    if df.empty:
+        return None
+    df = df.sort_values("date")
+    dates = df["date"].to_numpy()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=dates,
+        y=df["successful_calls"].to_numpy(),
+        name="Successful",
+        marker_color="#10b981"
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=dates,
+        y=df["failed_calls"].to_numpy(),
+        name="Failed",
+        marker_color="#ef4444"
+    ))
+    
+    fig.update_layout(
+        barmode="stack",
+        height=300,
+        xaxis_title="Date",
+        uirevision="constant",
+        yaxis_title="Number of Calls",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
 def format_number(num):
-    """Format large numbers with K, M suffixes."""
-    if num >= 1_000_000:
-        return f"{num/1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num/1_000:.1f}K"
+    """Format large numbers with K, M, B suffixes."""
+    for divisor, suffix in NUMBER_SUFFIXES:
+        if num >= divisor:
+            return f"{num/divisor:.1f}{suffix}"
     return str(num)
 
 
+def format_summary(summary):
+    """Format every numeric summary value for display in a single pass."""
+    display = {
+        key: format_number(value)
+        for key, value in summary.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    display["success_rate"] = f"{summary.get('success_rate', 100):.1f}%"
+    return display
+
+
 def get_success_rate_color(rate):
     """Get color based on success rate."""
     if rate >= 95:
@@ -110,7 +442,10 @@ def get_success_rate_color(rate):
 
 def main():
     # Header
-    st.markdown('<h1 class="main-header">📊 Cynchrony Analytics Dashboard</h1>', unsafe_allow_html=True)
+    st.markdown(
+        CUSTOM_CSS + '<h1 class="main-header">📊 Cynchrony Analytics Dashboard</h1>',
+        unsafe_allow_html=True
+    )
     
     # Sidebar
     with st.sidebar:
@@ -122,115 +457,65 @@ def main():
         refresh_interval = st.slider("Refresh interval (seconds)", 10, 120, REFRESH_INTERVAL)
         
         st.markdown("---")
-        st.markdown("### Quick Links")
-        st.markdown(f"- [API Docs]({BACKEND_URL}/docs)")
-        st.markdown(f"- [Health Check]({BACKEND_URL}/health)")
+        st.markdown(
+            "### Quick Links\n"
+            f"- [API Docs]({BACKEND_URL}/docs)\n"
+            f"- [Health Check]({BACKEND_URL}/health)"
+        )
         
         st.markdown("---")
         st.markdown("### Backend Status")
-        try:
-            health = requests.get(f"{BACKEND_URL}/health", timeout=5)
-            if health.status_code == 200:
-                st.success("✅ Backend Online")
-            else:
-                st.error("❌ Backend Error")
-        except:
-            st.error("❌ Backend Offline")
+        backend_status = st.empty()
         
-        if st.button("🔄 Refresh Now"):
-            st.rerun()
+        st.button("🔄 Refresh Now", on_click=bump_cache)
+    
+    # Dashboard body; auto-refresh reruns only this fragment
+    st.fragment(dashboard, run_every=refresh_interval if auto_refresh else None)(refresh_interval)
+    
+    # A successful summary fetch implies the backend is up; only probe otherwise
+    health_status = 200 if st.session_state.get("backend_ok") else check_health()
+    if health_status == 200:
+        backend_status.success("✅ Backend Online")
+    elif health_status is not None:
+        backend_status.error("❌ Backend Error")
+    else:
+        backend_status.error("❌ Backend Offline")
+
+
+def dashboard(refresh_interval: int):
+    """Fetch analytics data and render the metrics, charts and tables."""
+    # Fetch all data up front
+    results = fetch_with_breaker(st.session_state.get("cache_bust", 0), refresh_interval)
     
     # Fetch summary data
-    summary = fetch_data("summary")
+    summary = load(results, "summary")
+    backend_ok = summary is not None
+    if st.session_state.get("backend_ok", backend_ok) != backend_ok:
+        # The sidebar status lives outside this fragment; rerun the app to update it
+        st.session_state.backend_ok = backend_ok
+        st.rerun(scope="app")
+    st.session_state.backend_ok = backend_ok
     
     if summary is None:
         st.warning("Unable to fetch analytics data. Please check the backend connection.")
         st.info(f"Trying to connect to: {BACKEND_URL}")
         return
     
+    display = format_summary(summary)
+    
     # Main Metrics Row
     st.markdown("### 📈 Overview")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            label="Total API Calls",
-            value=format_number(summary.get("total_api_calls", 0)),
-            delta=None
-        )
-    
-    with col2:
-        success_rate = summary.get("success_rate", 100)
-        st.metric(
-            label="Success Rate",
-            value=f"{success_rate:.1f}%",
-            delta=None
-        )
-    
-    with col3:
-        st.metric(
-            label="Total Errors",
-            value=format_number(summary.get("total_errors", 0)),
-            delta=None
-        )
-    
-    with col4:
-        st.metric(
-            label="AI Chat Calls",
-            value=format_number(summary.get("ai_chat_calls", 0)),
-            delta=None
-        )
-    
-    with col5:
-        st.metric(
-            label="AI Generation",
-            value=format_number(summary.get("ai_generation_calls", 0)),
-            delta=None
-        )
+    for col, (label, key) in zip(st.columns(len(OVERVIEW_METRICS)), OVERVIEW_METRICS):
+        col.metric(label=label, value=display.get(key, "0"))
     
     st.markdown("---")
     
     # Processing Metrics Row
     st.markdown("### 🔧 Processing Operations")
     
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric(
-            label="📄 PDF Processing",
-            value=format_number(summary.get("pdf_processing", 0))
-        )
-    
-    with col2:
-        st.metric(
-            label="🖼️ Image Processing",
-            value=format_number(summary.get("image_processing", 0))
-        )
-    
-    with col3:
-        st.metric(
-            label="🎬 Video Processing",
-            value=format_number(summary.get("video_processing", 0))
-        )
-    
-    with col4:
-        st.metric(
-            label="🎵 Audio Processing",
-            value=format_number(summary.get("audio_processing", 0))
-        )
-    
-    with col5:
-        st.metric(
-            label="💻 Code Executions",
-            value=format_number(summary.get("code_executions", 0))
-        )
-    
-    with col6:
-        st.metric(
-            label="📁 File Uploads",
-            value=format_number(summary.get("file_uploads", 0))
-        )
+    for col, (label, key) in zip(st.columns(len(PROCESSING_METRICS)), PROCESSING_METRICS):
+        col.metric(label=label, value=display.get(key, "0"))
     
     st.markdown("---")
     
@@ -242,51 +527,18 @@ def main():
         
         category_data = summary.get("category_breakdown", {})
         if category_data:
-            df = pd.DataFrame([
-                {"Category": k.replace("_", " ").title(), "Count": v}
-                for k, v in category_data.items()
-            ])
-            df = df.sort_values("Count", ascending=True)
-            
-            fig = px.bar(
-                df,
-                x="Count",
-                y="Category",
-                orientation="h",
-                color="Count",
-                color_continuous_scale="Viridis"
-            )
-            fig.update_layout(
-                height=400,
-                showlegend=False,
-                xaxis_title="Number of Calls",
-                yaxis_title=""
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(make_category_fig(category_data), use_container_width=True, config=PLOTLY_CONFIG)
         else:
             st.info("No category data available yet.")
     
     with col2:
         st.markdown("### 🎯 Top Endpoints")
         
-        endpoints = fetch_data("endpoints")
+        endpoints = load(results, "endpoints")
         if endpoints:
-            df = pd.DataFrame(endpoints[:10])
-            if not df.empty:
-                fig = px.bar(
-                    df,
-                    x="count",
-                    y="endpoint",
-                    orientation="h",
-                    color="success_rate",
-                    color_continuous_scale="RdYlGn",
-                    labels={"count": "Calls", "endpoint": "Endpoint", "success_rate": "Success %"}
-                )
-                fig.update_layout(
-                    height=400,
-                    yaxis={"categoryorder": "total ascending"}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            fig = make_endpoints_fig(endpoints)
+            if fig is not None:
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
         else:
             st.info("No endpoint data available yet.")
     
@@ -295,45 +547,11 @@ def main():
     # Hourly Stats
     st.markdown("### ⏰ Hourly Activity (Last 24 Hours)")
     
-    hourly = fetch_data("hourly")
-    if hourly:
-        df = pd.DataFrame(hourly)
-        if not df.empty:
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=df["hour"],
-                y=df["count"],
-                mode="lines+markers",
-                name="Total Calls",
-                line=dict(color="#667eea", width=2),
-                fill="tozeroy",
-                fillcolor="rgba(102, 126, 234, 0.2)"
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=df["hour"],
-                y=df["success_count"],
-                mode="lines+markers",
-                name="Successful",
-                line=dict(color="#10b981", width=2)
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=df["hour"],
-                y=df["error_count"],
-                mode="lines+markers",
-                name="Errors",
-                line=dict(color="#ef4444", width=2)
-            ))
-            
-            fig.update_layout(
-                height=300,
-                xaxis_title="Hour",
-                yaxis_title="Number of Calls",
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    hourly = load(results, "hourly")
+    if hourly is not None and len(hourly):
+        fig = make_hourly_fig(hourly)
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
     else:
         st.info("No hourly data available yet.")
     
@@ -342,60 +560,28 @@ def main():
     # Business Metrics Row
     st.markdown("### 💼 Business Metrics")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            label="🔐 Auth Events",
-            value=format_number(summary.get("authentication_events", 0))
-        )
-    
-    with col2:
-        st.metric(
-            label="💳 Payment Events",
-            value=format_number(summary.get("payment_events", 0))
-        )
-    
-    with col3:
-        st.metric(
-            label="📝 Assessments",
-            value=format_number(summary.get("assessment_events", 0))
-        )
-    
-    with col4:
-        st.metric(
-            label="🎤 Interviews",
-            value=format_number(summary.get("interview_events", 0))
-        )
-    
-    with col5:
-        st.metric(
-            label="📄 Resume Ops",
-            value=format_number(summary.get("resume_operations", 0))
-        )
+    for col, (label, key) in zip(st.columns(len(BUSINESS_METRICS)), BUSINESS_METRICS):
+        col.metric(label=label, value=display.get(key, "0"))
     
     st.markdown("---")
     
     # Recent Errors
     st.markdown("### ⚠️ Recent Errors")
     
-    errors = fetch_data("errors")
+    errors = load(results, "errors")
     if errors:
-        df = pd.DataFrame(errors[:20])
-        if not df.empty:
-            st.dataframe(
-                df,
-                use_container_width=True,
-                column_config={
-                    "endpoint": st.column_config.TextColumn("Endpoint", width="medium"),
-                    "method": st.column_config.TextColumn("Method", width="small"),
-                    "status_code": st.column_config.NumberColumn("Status", width="small"),
-                    "error": st.column_config.TextColumn("Error Message", width="large"),
-                    "timestamp": st.column_config.TextColumn("Timestamp", width="medium")
-                }
-            )
-        else:
-            st.success("🎉 No errors recorded!")
+        recent = errors[:20]
+        try:
+            # Missing fields become nulls; the schema fixes column order and types
+            table = pa.Table.from_pylist(recent, schema=ERROR_SCHEMA)
+            table = table.rename_columns([label for _, label, _ in ERROR_COLUMNS])
+        except pa.ArrowException:
+            # Values that don't fit the schema (e.g. a textual status code) are shown as text
+            table = {
+                label: [None if error.get(key) is None else str(error[key]) for error in recent]
+                for key, label, _ in ERROR_COLUMNS
+            }
+        st.table(table)
     else:
         st.success("🎉 No errors recorded!")
     
@@ -404,56 +590,17 @@ def main():
     # Daily Stats
     st.markdown("### 📅 Daily Statistics (Last 30 Days)")
     
-    daily = fetch_data("daily")
-    if daily:
-        df = pd.DataFrame(daily)
-        if not df.empty:
-            df = df.sort_values("date")
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=df["date"],
-                y=df["successful_calls"],
-                name="Successful",
-                marker_color="#10b981"
-            ))
-            
-            fig.add_trace(go.Bar(
-                x=df["date"],
-                y=df["failed_calls"],
-                name="Failed",
-                marker_color="#ef4444"
-            ))
-            
-            fig.update_layout(
-                barmode="stack",
-                height=300,
-                xaxis_title="Date",
-                yaxis_title="Number of Calls",
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    daily = load(results, "daily")
+    if daily is not None and len(daily):
+        fig = make_daily_fig(daily)
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
     else:
         st.info("No daily data available yet.")
     
     # Footer
     st.markdown("---")
-    st.markdown(
-        f"""
-        <div style="text-align: center; color: #6b7280; font-size: 0.875rem;">
-            Cynchrony Analytics Dashboard | Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            <br>
-            Connected to: {BACKEND_URL}
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-    
-    # Auto-refresh
-    if auto_refresh:
-        time.sleep(refresh_interval)
-        st.rerun()
+    st.caption(FOOTER_TEMPLATE.format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
 
 
 if __name__ == "__main__":